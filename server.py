@@ -1,13 +1,20 @@
 from mcp.server.fastmcp import FastMCP
+import json
 import os
-from dotenv import load_dotenv
+from typing import List, Tuple
 
 # Import your existing optimization functions
 from tools.optimize import optimize_prompt, score_prompt
 
-load_dotenv()
+# Only pay for importing dotenv when there is a local .env to load; deployed
+# environments inject their variables directly.
+_DOTENV_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
+if os.path.exists(_DOTENV_PATH):
+    from dotenv import load_dotenv
 
-PORT = os.environ.get("PORT", 10000)
+    load_dotenv(_DOTENV_PATH)
+
+PORT = int(os.environ.get("PORT", "10000"))
 mcp = FastMCP("Prompt Optimizer MCP", host="0.0.0.0", port=PORT)
 
 @mcp.tool()
@@ -17,8 +24,8 @@ def optimize_prompt_tool(raw_prompt: str, style: str) -> str:
     Styles: creative, precise, fast.
     """
     try:
-        variants = optimize_prompt(raw_prompt, style)
-        return "\n\n".join(f"Variant {i+1}: {v}" for i, v in enumerate(variants))
+        v1, v2, v3 = optimize_prompt(raw_prompt, style)
+        return f"Variant 1: {v1}\n\nVariant 2: {v2}\n\nVariant 3: {v3}"
     except Exception as e:
         return f"Prompt optimization failed: {str(e)}"
 
@@ -34,5 +41,27 @@ def score_prompt_tool(raw_prompt: str, improved_prompt: str) -> str:
     except Exception as e:
         return f"Prompt scoring failed: {str(e)}"
 
+@mcp.tool()
+def batch_optimize_prompt_tool(prompts: List[str], style: str) -> str:
+    """
+    Generate 3 optimized variants for each raw LLM prompt in a chosen style.
+    Returns a JSON list holding the 3 variants of each prompt, in input order.
+    """
+    try:
+        return json.dumps([list(optimize_prompt(p, style)) for p in prompts])
+    except Exception as e:
+        return f"Batch prompt optimization failed: {str(e)}"
+
+@mcp.tool()
+def batch_score_prompt_tool(pairs: List[Tuple[str, str]]) -> str:
+    """
+    Score each (raw_prompt, improved_prompt) pair.
+    Returns a JSON list of effectiveness scores between 0 and 1, in input order.
+    """
+    try:
+        return json.dumps([score_prompt(raw, improved) for raw, improved in pairs])
+    except Exception as e:
+        return f"Batch prompt scoring failed: {str(e)}"
+
 if __name__ == "__main__":
     mcp.run(transport="stdio")
@@ -0,0 +1,38 @@
+"""
+Packaging for the Prompt Optimizer MCP server.
+
+When Cython and a C compiler are available, tools/optimize.py is compiled to a
+C extension (with the static types declared in tools/optimize.pxd); otherwise
+the pure-Python module is installed unchanged.
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:  # Optional build dependency; ship the pure-Python module
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        ["tools/optimize.py"],
+        # Take C types from the .pxd only; the .py annotations stay Python-level.
+        compiler_directives={"language_level": "3", "annotation_typing": False},
+    )
+    # Without a working C compiler, install the pure-Python module instead.
+    for extension in ext_modules:
+        extension.optional = True
+
+with open("requirements.txt") as f:
+    install_requires = f.read().split()
+
+setup(
+    name="prompt-optimizer-mcp",
+    version="0.1.0",
+    description="MCP server for optimizing and scoring LLM prompts",
+    license="MIT",
+    python_requires=">=3.11",
+    packages=["tools"],
+    py_modules=["server"],
+    install_requires=install_requires,
+    ext_modules=ext_modules,
+)
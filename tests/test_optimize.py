@@ -0,0 +1,99 @@
+"""
+Unit tests for tools.optimize.
+"""
+
+import random
+import re
+import sys
+import unittest
+
+from tools import optimize
+from tools.optimize import _shorten_words, optimize_prompt, score_prompt
+
+
+def _regex_shorten(text):
+    """Reference result: the compiled _SHORT_RE path _shorten_words falls back to."""
+    return optimize._SHORT_RE.sub(
+        lambda m: optimize._SHORT_REPLACEMENTS[m.lastindex - 1], text
+    )
+
+
+@unittest.skipIf(optimize._SHORT_AUTOMATON is None, "pyahocorasick not installed")
+class TestShortenWords(unittest.TestCase):
+    """The Aho-Corasick path must agree with _SHORT_RE on every input."""
+
+    def test_boundaries_follow_regex_word_chars(self):
+        # U+0301 is a combining mark: not \w, so "Utilize" still ends on a \b.
+        # "İ" forces the regex fallback; the result must not change with it.
+        for text in [
+            "Utilizé it",
+            "Utilizé it İ",
+            "utilize_it",
+            "re-utilize it",
+            "utilize2",
+        ]:
+            self.assertEqual(_shorten_words(text), _regex_shorten(text), text)
+
+    def test_ignorecase_folding(self):
+        for text in ["ſubſequently", "İllustrate", "ıllustrate"]:
+            self.assertEqual(_shorten_words(text), _regex_shorten(text), text)
+
+    def test_fold_table_matches_ignorecase(self):
+        letters = sorted(set("".join(optimize._SHORT_SYNONYMS)))
+        any_letter = re.compile(f"[{''.join(letters)}]", re.IGNORECASE)
+        for cp in range(sys.maxunicode + 1):
+            char = chr(cp)
+            folded = char.translate(optimize._IGNORECASE_FOLD_TABLE).lower()
+            if any_letter.fullmatch(char):
+                self.assertIn(folded, letters, hex(cp))
+                self.assertTrue(re.fullmatch(folded, char, re.IGNORECASE), hex(cp))
+            else:
+                self.assertNotIn(folded, letters, hex(cp))
+
+    def test_randomized_equivalence(self):
+        pieces = list(optimize._SHORT_SYNONYMS) + [
+            "UTILIZE",
+            "Furthermore",
+            "ſubſequently",
+            "İllustrate",
+            "x",
+            "_",
+            "1",
+            "é",
+            "́",
+            "İ",
+            "ß",
+            " ",
+            "\n",
+            "-",
+            ".",
+        ]
+        rng = random.Random(1)
+        for _ in range(50000):
+            text = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 12)))
+            self.assertEqual(_shorten_words(text), _regex_shorten(text), repr(text))
+
+
+class TestFastVariants(unittest.TestCase):
+    """The polite-phrase prefilter must never skip a prompt _POLITE_RE matches."""
+
+    def test_polite_prefilter_matches_ignorecase(self):
+        self.assertEqual(optimize_prompt("Pleaſe write it", "fast")[1], "write it")
+
+
+class TestScorePrompt(unittest.TestCase):
+    """Validation and length scoring (whitespace tokens, punctuation included)."""
+
+    def test_non_string_input_is_rejected_before_caching(self):
+        with self.assertRaisesRegex(TypeError, "must be strings"):
+            score_prompt(["a"], "b")
+
+    def test_punctuation_only_prompt_is_not_empty(self):
+        self.assertEqual(score_prompt("...", "abc"), 0.92)
+
+    def test_dropping_punctuation_token_changes_length(self):
+        self.assertEqual(score_prompt("hello - world", "hello world"), 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,9 @@
+# Static types applied to tools/optimize.py when it is compiled with Cython.
+
+cpdef double _combine_scores(
+    int raw_length,
+    int improved_length,
+    int raw_redundant,
+    int improved_redundant,
+    double keyword_score,
+)
@@ -5,12 +5,109 @@ This module provides stateless, deterministic functions for optimizing and scori
 """
 
 import re
-from typing import List, Literal
+import string
+from functools import lru_cache
+from typing import Callable, List, Literal, NamedTuple
+
+try:
+    import ahocorasick
+except ImportError:  # Optional accelerator; fall back to the compiled regex
+    ahocorasick = None
+
+
+class Variants(NamedTuple):
+    """The 3 prompt variants produced for a single optimization style."""
+
+    v1: str
+    v2: str
+    v3: str
+
+
+_ENHANCED_WORDS = {
+    "write": "craft a compelling",
+    "create": "design an innovative",
+    "explain": "elaborate on the fascinating",
+    "describe": "paint a vivid picture of",
+    "analyze": "dive deep into the intricate",
+    "help": "assist with the remarkable",
+    "show": "demonstrate the extraordinary",
+    "tell": "share the captivating",
+}
+
+# Checked in order; only the first word found in the prompt is enhanced.
+_ENHANCED_PATTERNS = [
+    (word, re.compile(rf"\b{word}\b", re.IGNORECASE), replacement)
+    for word, replacement in _ENHANCED_WORDS.items()
+]
+
+_ENGAGING_START = "Imagine you're an expert in this field. "
+
+_CREATIVE_MODIFIER = "in a way that captivates and inspires"
+
+_CONSTRAINT_PHRASE = "Be specific and concise."
+
+_SHORT_SYNONYMS = {
+    "utilize": "use",
+    "implement": "use",
+    "demonstrate": "show",
+    "illustrate": "show",
+    "elaborate": "explain",
+    "comprehensive": "complete",
+    "subsequently": "then",
+    "furthermore": "also",
+    "additionally": "also",
+    "nevertheless": "but",
+}
+
+# One capturing group per key, so a match maps back to its replacement by group
+# index however it was cased ("ſ" and "İ" match "s" and "i" but don't lower to them).
+_SHORT_RE = re.compile(
+    r"\b(?:" + "|".join(f"({re.escape(w)})" for w in _SHORT_SYNONYMS) + r")\b",
+    re.IGNORECASE,
+)
+_SHORT_REPLACEMENTS = tuple(_SHORT_SYNONYMS.values())
+
+# Characters that re.IGNORECASE matches to the ASCII letters of the synonym keys
+# but that str.lower() leaves alone ("ı", "ſ") or expands ("İ").
+_IGNORECASE_FOLD_TABLE = str.maketrans({"İ": "i", "ı": "i", "ſ": "s"})
+
+# Word characters exactly as the re engine's \w (and so \b) sees them.
+_WORD_CHAR_RE = re.compile(r"\w")
+
+# Single-scan matcher for the synonym keys, storing (key length, replacement).
+if ahocorasick is not None:
+    _SHORT_AUTOMATON = ahocorasick.Automaton()
+    for _long_word, _short_word in _SHORT_SYNONYMS.items():
+        _SHORT_AUTOMATON.add_word(_long_word, (len(_long_word), _short_word))
+    _SHORT_AUTOMATON.make_automaton()
+else:
+    _SHORT_AUTOMATON = None
+
+_SPEED_INDICATOR = "Quick response: "
+
+# Filler words removed by the precise style.
+_REDUNDANT_ALTERNATION = r"very|quite|really|actually|just|simply|kind of|sort of"
+_REDUNDANT_RE = re.compile(rf"\b(?:{_REDUNDANT_ALTERNATION})\s+", re.IGNORECASE)
+
+# Politeness phrases stripped by the fast style's imperative variant.
+_POLITE_ALTERNATION = r"please|could you|would you"
+_POLITE_RE = re.compile(rf"\b(?:{_POLITE_ALTERNATION})\s+", re.IGNORECASE)
+
+# Filler and politeness phrases counted against clarity when scoring.
+_FILLER_RE = re.compile(
+    rf"\b(?:{_REDUNDANT_ALTERNATION}|{_POLITE_ALTERNATION})\s+", re.IGNORECASE
+)
+
+# Deletes ASCII punctuation before splitting prompts into words.
+_PUNCT_TABLE = str.maketrans("", "", string.punctuation)
+
+# Maps every sentence terminator to "." so prompts can be split with str.split.
+_SENTENCE_END_TABLE = str.maketrans("!?", "..")
 
 
 def optimize_prompt(
     raw_prompt: str, style: Literal["creative", "precise", "fast"]
-) -> List[str]:
+) -> Variants:
     """
     Generate 3 optimized variants of the raw LLM prompt in the specified style.
 
@@ -19,7 +116,7 @@ def optimize_prompt(
         style: The optimization style - 'creative', 'precise', or 'fast'
 
     Returns:
-        List[str]: 3 optimized prompt variants
+        Variants: 3 optimized prompt variants
 
     Raises:
         TypeError: If inputs are not strings or style is invalid
@@ -27,92 +124,59 @@ def optimize_prompt(
     # Input validation
     if not isinstance(raw_prompt, str):
         raise TypeError("raw_prompt must be a string")
-    if not isinstance(style, str) or style not in ["creative", "precise", "fast"]:
+    handler = _STYLE_HANDLERS.get(style) if isinstance(style, str) else None
+    if handler is None:
         raise TypeError("style must be one of: 'creative', 'precise', 'fast'")
 
     # Clean and normalize the input prompt
     raw_prompt = raw_prompt.strip()
     if not raw_prompt:
-        return ["", "", ""]
+        return Variants("", "", "")
 
+    return _optimize_normalized(raw_prompt, handler)
+
+
+@lru_cache(maxsize=1024)
+def _optimize_normalized(
+    raw_prompt: str, handler: Callable[[str, List[str]], Variants]
+) -> Variants:
+    """Run a style handler on a stripped, non-empty prompt (memoized)."""
     # Split into sentences for better processing
-    sentences = re.split(r"[.!?]+", raw_prompt)
+    sentences = raw_prompt.translate(_SENTENCE_END_TABLE).split(".")
     sentences = [s.strip() for s in sentences if s.strip()]
 
-    if style == "creative":
-        return _create_creative_variants(raw_prompt, sentences)
-    elif style == "precise":
-        return _create_precise_variants(raw_prompt, sentences)
-    else:  # fast
-        return _create_fast_variants(raw_prompt, sentences)
+    return handler(raw_prompt, sentences)
 
 
-def _create_creative_variants(raw_prompt: str, sentences: List[str]) -> List[str]:
+def _create_creative_variants(raw_prompt: str, sentences: List[str]) -> Variants:
     """Create creative variants with enhanced adjectives and imaginative language."""
     if not sentences:
-        return [raw_prompt, raw_prompt, raw_prompt]
+        return Variants(raw_prompt, raw_prompt, raw_prompt)
 
     # Variant 1: Add descriptive adjectives
-    enhanced_words = {
-        "write": "craft a compelling",
-        "create": "design an innovative",
-        "explain": "elaborate on the fascinating",
-        "describe": "paint a vivid picture of",
-        "analyze": "dive deep into the intricate",
-        "help": "assist with the remarkable",
-        "show": "demonstrate the extraordinary",
-        "tell": "share the captivating",
-    }
-
     variant1 = raw_prompt
-    for word, replacement in enhanced_words.items():
-        if word in variant1.lower():
-            variant1 = re.sub(
-                rf"\b{word}\b", replacement, variant1, flags=re.IGNORECASE
-            )
+    lowered = raw_prompt.lower()
+    for word, pattern, replacement in _ENHANCED_PATTERNS:
+        if word in lowered:
+            variant1 = pattern.sub(replacement, variant1)
             break
 
     # Variant 2: Add engaging opening phrases
-    engaging_starts = [
-        "Imagine you're an expert in this field. ",
-        "Picture yourself as a master of this subject. ",
-        "As a seasoned professional, ",
-        "With your deep expertise, ",
-    ]
-    variant2 = engaging_starts[0] + raw_prompt
+    variant2 = f"{_ENGAGING_START}{raw_prompt}"
 
     # Variant 3: Add creative modifiers
-    creative_modifiers = [
-        "in a way that captivates and inspires",
-        "with creativity and originality",
-        "in an engaging and memorable manner",
-        "with flair and imagination",
-    ]
-    variant3 = raw_prompt + ". " + creative_modifiers[0]
+    variant3 = f"{raw_prompt}. {_CREATIVE_MODIFIER}"
 
-    return [variant1, variant2, variant3]
+    return Variants(variant1, variant2, variant3)
 
 
-def _create_precise_variants(raw_prompt: str, sentences: List[str]) -> List[str]:
+def _create_precise_variants(raw_prompt: str, sentences: List[str]) -> Variants:
     """Create precise variants with concise, focused language."""
     if not sentences:
-        return [raw_prompt, raw_prompt, raw_prompt]
+        return Variants(raw_prompt, raw_prompt, raw_prompt)
 
     # Variant 1: Remove redundant words
-    redundant_patterns = [
-        (r"\bvery\s+", ""),
-        (r"\bquite\s+", ""),
-        (r"\breally\s+", ""),
-        (r"\bactually\s+", ""),
-        (r"\bjust\s+", ""),
-        (r"\bsimply\s+", ""),
-        (r"\bkind of\s+", ""),
-        (r"\bsort of\s+", ""),
-    ]
-
-    variant1 = raw_prompt
-    for pattern, replacement in redundant_patterns:
-        variant1 = re.sub(pattern, replacement, variant1, flags=re.IGNORECASE)
+    variant1 = _REDUNDANT_RE.sub("", raw_prompt)
 
     # Variant 2: Use bullet points for clarity
     if len(sentences) > 1:
@@ -121,54 +185,74 @@ def _create_precise_variants(raw_prompt: str, sentences: List[str]) -> List[str]
         variant2 = raw_prompt
 
     # Variant 3: Add specific constraints
-    constraint_phrases = [
-        "Be specific and concise.",
-        "Provide clear, actionable guidance.",
-        "Focus on the most important aspects.",
-    ]
-    variant3 = raw_prompt + " " + constraint_phrases[0]
+    variant3 = f"{raw_prompt} {_CONSTRAINT_PHRASE}"
 
-    return [variant1, variant2, variant3]
+    return Variants(variant1, variant2, variant3)
 
 
-def _create_fast_variants(raw_prompt: str, sentences: List[str]) -> List[str]:
+def _create_fast_variants(raw_prompt: str, sentences: List[str]) -> Variants:
     """Create fast variants optimized for quick processing."""
     if not sentences:
-        return [raw_prompt, raw_prompt, raw_prompt]
+        return Variants(raw_prompt, raw_prompt, raw_prompt)
 
     # Variant 1: Use shorter synonyms
-    short_synonyms = {
-        "utilize": "use",
-        "implement": "use",
-        "demonstrate": "show",
-        "illustrate": "show",
-        "elaborate": "explain",
-        "comprehensive": "complete",
-        "subsequently": "then",
-        "furthermore": "also",
-        "additionally": "also",
-        "nevertheless": "but",
-    }
-
-    variant1 = raw_prompt
-    for long_word, short_word in short_synonyms.items():
-        variant1 = re.sub(
-            rf"\b{long_word}\b", short_word, variant1, flags=re.IGNORECASE
-        )
+    variant1 = _shorten_words(raw_prompt)
 
     # Variant 2: Use imperative form
-    variant2 = raw_prompt
-    # Convert "Please write..." to "Write..."
-    variant2 = re.sub(r"\bplease\s+", "", variant2, flags=re.IGNORECASE)
-    # Convert "Could you..." to direct commands
-    variant2 = re.sub(r"\bcould you\s+", "", variant2, flags=re.IGNORECASE)
-    variant2 = re.sub(r"\bwould you\s+", "", variant2, flags=re.IGNORECASE)
+    # Convert "Please write..." / "Could you write..." to "Write..."
+    # Plain substring checks skip the regex for prompts with no polite phrasing;
+    # casefold() folds everything IGNORECASE matches to these letters (e.g. "ſ").
+    folded = raw_prompt.casefold()
+    if "please" in folded or "you" in folded:
+        variant2 = _POLITE_RE.sub("", raw_prompt)
+    else:
+        variant2 = raw_prompt
 
     # Variant 3: Add speed indicators
-    speed_indicators = ["Quick response: ", "Fast answer: ", "Brief: ", "Short: "]
-    variant3 = speed_indicators[0] + raw_prompt
+    variant3 = f"{_SPEED_INDICATOR}{raw_prompt}"
+
+    return Variants(variant1, variant2, variant3)
+
+
+def _shorten_words(text: str) -> str:
+    """Replace whole-word, case-insensitive synonym keys with their short forms."""
+    # Fold the text the way _SHORT_RE's IGNORECASE does, so both paths agree.
+    folded = text.translate(_IGNORECASE_FOLD_TABLE).lower()
+    # Automaton offsets are taken from the folded copy, so they only line up
+    # with the original when folding preserves the length.
+    if _SHORT_AUTOMATON is None or len(folded) != len(text):
+        return _SHORT_RE.sub(lambda m: _SHORT_REPLACEMENTS[m.lastindex - 1], text)
 
-    return [variant1, variant2, variant3]
+    pieces = []
+    last = 0
+    for end, (length, short_word) in _SHORT_AUTOMATON.iter(folded):
+        start = end - length + 1
+        if (
+            start < last
+            or _is_word_char(text, start - 1)
+            or _is_word_char(text, end + 1)
+        ):
+            continue
+        pieces.append(text[last:start])
+        pieces.append(short_word)
+        last = end + 1
+
+    if not pieces:
+        return text
+    pieces.append(text[last:])
+    return "".join(pieces)
+
+
+def _is_word_char(text: str, index: int) -> bool:
+    """Return True if text[index] exists and is a word character for \\b."""
+    return 0 <= index < len(text) and _WORD_CHAR_RE.match(text, index) is not None
+
+
+_STYLE_HANDLERS = {
+    "creative": _create_creative_variants,
+    "precise": _create_precise_variants,
+    "fast": _create_fast_variants,
+}
 
 
 def score_prompt(raw_prompt: str, improved_prompt: str) -> float:
@@ -194,21 +278,62 @@ def score_prompt(raw_prompt: str, improved_prompt: str) -> float:
     if not isinstance(raw_prompt, str) or not isinstance(improved_prompt, str):
         raise TypeError("Both raw_prompt and improved_prompt must be strings")
 
+    # Normalize prompts
+    raw_prompt = raw_prompt.strip()
+    improved_prompt = improved_prompt.strip()
+
     # Handle edge cases
-    if not raw_prompt.strip():
-        return 0.0 if improved_prompt.strip() else 1.0
+    if not raw_prompt:
+        return 0.0 if improved_prompt else 1.0
 
-    if not improved_prompt.strip():
+    if not improved_prompt:
         return 0.0
 
-    # Normalize prompts
-    raw_prompt = raw_prompt.strip()
-    improved_prompt = improved_prompt.strip()
+    return _score_normalized(raw_prompt, improved_prompt)
 
-    # Calculate length score (40% weight)
-    raw_length = len(raw_prompt.split())
-    improved_length = len(improved_prompt.split())
 
+@lru_cache(maxsize=4096)
+def _score_normalized(raw_prompt: str, improved_prompt: str) -> float:
+    """Score a pair of stripped, non-empty prompts (memoized)."""
+    # Tokenize once; the tokens feed both the length and keyword scores
+    raw_tokens = raw_prompt.lower().split()
+    improved_tokens = improved_prompt.lower().split()
+
+    # Word counts for the length score (40% weight)
+    raw_length = len(raw_tokens)
+    improved_length = len(improved_tokens)
+
+    # Calculate keyword preservation score (30% weight)
+    raw_words = {t.translate(_PUNCT_TABLE) for t in raw_tokens} - {""}
+    improved_words = {t.translate(_PUNCT_TABLE) for t in improved_tokens} - {""}
+
+    if not raw_words:
+        keyword_score = 1.0
+    else:
+        # Calculate Jaccard similarity; |A ∪ B| = |A| + |B| - |A ∩ B| avoids
+        # materializing the union set
+        intersection = len(raw_words.intersection(improved_words))
+        union = len(raw_words) + len(improved_words) - intersection
+        keyword_score = intersection / union if union else 0.0
+
+    # Count redundant phrases and filler words for the clarity score (30% weight)
+    raw_redundant = len(_FILLER_RE.findall(raw_prompt))
+    improved_redundant = len(_FILLER_RE.findall(improved_prompt))
+
+    return _combine_scores(
+        raw_length, improved_length, raw_redundant, improved_redundant, keyword_score
+    )
+
+
+def _combine_scores(
+    raw_length: int,
+    improved_length: int,
+    raw_redundant: int,
+    improved_redundant: int,
+    keyword_score: float,
+) -> float:
+    """Combine word and filler counts with the keyword score into the final score."""
+    # Calculate length score (40% weight)
     if raw_length == 0:
         length_score = 1.0
     else:
@@ -223,43 +348,7 @@ def score_prompt(raw_prompt: str, improved_prompt: str) -> float:
         else:
             length_score = 0.4  # Too long gets penalized
 
-    # Calculate keyword preservation score (30% weight)
-    raw_words = set(re.findall(r"\b\w+\b", raw_prompt.lower()))
-    improved_words = set(re.findall(r"\b\w+\b", improved_prompt.lower()))
-
-    if not raw_words:
-        keyword_score = 1.0
-    else:
-        # Calculate Jaccard similarity
-        intersection = raw_words.intersection(improved_words)
-        union = raw_words.union(improved_words)
-        keyword_score = len(intersection) / len(union) if union else 0.0
-
     # Calculate clarity score (30% weight)
-    # Count redundant phrases and filler words
-    redundant_patterns = [
-        r"\bvery\s+",
-        r"\bquite\s+",
-        r"\breally\s+",
-        r"\bactually\s+",
-        r"\bjust\s+",
-        r"\bsimply\s+",
-        r"\bkind of\s+",
-        r"\bsort of\s+",
-        r"\bplease\s+",
-        r"\bcould you\s+",
-        r"\bwould you\s+",
-    ]
-
-    raw_redundant = sum(
-        len(re.findall(pattern, raw_prompt, re.IGNORECASE))
-        for pattern in redundant_patterns
-    )
-    improved_redundant = sum(
-        len(re.findall(pattern, improved_prompt, re.IGNORECASE))
-        for pattern in redundant_patterns
-    )
-
     # Fewer redundant words = better clarity
     if raw_redundant == 0:
         clarity_score = 1.0 if improved_redundant == 0 else 0.7